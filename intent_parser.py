@@ -5,10 +5,75 @@ No LLM needed - uses keyword matching and patterns
 """
 
 import re
-from typing import Dict, List, Optional
+import sys
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+
+def _build_keyword_scanner(buckets):
+    """
+    Build a single-pass keyword scanner from the category keyword tables.
+
+    Returns an (index, pattern) pair: `index` maps each keyword to every
+    (bucket, label) pair it belongs to, and `pattern` is one compiled regex
+    that reports every keyword occurrence in one left-to-right pass (a
+    lookahead is used so overlapping keywords are all reported, matching the
+    semantics of the old per-keyword substring scans).
+    """
+    # Keywords are interned so index hits during scanning compare by
+    # pointer before falling back to character comparison
+    index: Dict[str, List[Tuple[str, str]]] = {}
+    for bucket, table in buckets:
+        for label, keywords in table.items():
+            for keyword in keywords:
+                index.setdefault(sys.intern(keyword), []).append((bucket, sys.intern(label)))
+
+    # A keyword that is a prefix of a longer keyword (e.g. 'card' / 'cards')
+    # would be hidden when the longer one matches at the same position, so
+    # fold its entries into the longer keyword's entry list.
+    for keyword, entries in index.items():
+        for other, other_entries in index.items():
+            if other is not keyword and keyword.startswith(other):
+                for entry in other_entries:
+                    if entry not in entries:
+                        entries.append(entry)
+
+    alternation = '|'.join(
+        re.escape(keyword)
+        for keyword in sorted(index, key=len, reverse=True)
+    )
+    # Case folding happens inside the matcher, so parse() never needs to
+    # allocate a lowercased copy of the input
+    pattern = re.compile(f'(?=({alternation}))', re.IGNORECASE)
+    return index, pattern
+
+
+def _first_int(text: str) -> Optional[int]:
+    """
+    Return the first standalone integer in text, or None.
+
+    Single character walk with no allocation on the common no-digit path;
+    mirrors the word-boundary semantics of the old \\b\\d+\\b regex, so a
+    digit run glued to a word ('v2x') is skipped.
+    """
+    i, n = 0, len(text)
+    while i < n:
+        if text[i].isdecimal():
+            j = i + 1
+            while j < n and text[j].isdecimal():
+                j += 1
+            before = text[i - 1] if i else ''
+            after = text[j] if j < n else ''
+            if not (before.isalnum() or before == '_') and \
+               not (after.isalnum() or after == '_'):
+                return int(text[i:j])
+            i = j
+        i += 1
+    return None
+
+
+@dataclass(slots=True, frozen=True)
 class Intent:
     """Represents the parsed user intent"""
     primary_action: str  # create, add, modify, remove
@@ -73,7 +138,12 @@ class IntentParser:
         'yellow': ['yellow', 'warning'],
         'gray': ['gray', 'grey', 'neutral'],
     }
-    
+
+    SIZES = {
+        'large': ['large', 'big'],
+        'small': ['small', 'tiny'],
+    }
+
     def __init__(self):
         """Initialize the intent parser"""
         pass
@@ -87,23 +157,33 @@ class IntentParser:
             
         Returns:
             Intent object with parsed information
+
+        Repeated prompts hit an LRU cache keyed on the stripped input;
+        callers share the cached Intent and should not mutate it.
         """
-        user_input = user_input.lower().strip()
-        
+        return self._parse_normalized(user_input.strip())
+
+    @lru_cache(maxsize=256)
+    def _parse_normalized(self, user_input: str) -> Intent:
+        """Parse an already stripped input string (matching is caseless)"""
+        # Find every keyword occurrence in one pass over the input
+        hits = self._scan_keywords(user_input)
+
         # Extract action
-        action = self._extract_action(user_input)
-        
+        action = self._extract_action(hits)
+
         # Extract UI type
-        ui_type = self._extract_ui_type(user_input)
-        
-        # Extract components
-        components = self._extract_components(user_input)
-        
+        ui_type = self._extract_ui_type(hits)
+
+        # Extract components (falls back to ui_type defaults, so thread
+        # the value computed above instead of re-deriving it)
+        components = self._extract_components(hits, ui_type)
+
         # Extract layout
-        layout = self._extract_layout(user_input)
-        
+        layout = self._extract_layout(hits)
+
         # Extract modifiers (variant, color, etc.)
-        modifiers = self._extract_modifiers(user_input)
+        modifiers = self._extract_modifiers(user_input, hits)
         
         # Calculate confidence
         confidence = self._calculate_confidence(action, ui_type, components)
@@ -117,77 +197,81 @@ class IntentParser:
             confidence=confidence
         )
     
-    def _extract_action(self, text: str) -> str:
-        """Extract the primary action from text"""
-        for action, keywords in self.ACTIONS.items():
-            if any(keyword in text for keyword in keywords):
+    def _scan_keywords(self, text: str) -> frozenset:
+        """Collect every (category, label) keyword hit in a single pass"""
+        hits = set()
+        index = self._KEYWORD_INDEX
+        for match in self._KEYWORD_RE.finditer(text):
+            hits.update(index[match.group(1).lower()])
+        return frozenset(hits)
+
+    def _extract_action(self, hits: frozenset) -> str:
+        """Extract the primary action from keyword hits"""
+        for action in self.ACTIONS:
+            if ('action', action) in hits:
                 return action
         return 'create'  # Default action
-    
-    def _extract_ui_type(self, text: str) -> str:
-        """Extract the UI type from text"""
-        for ui_type, keywords in self.UI_TYPES.items():
-            if any(keyword in text for keyword in keywords):
+
+    def _extract_ui_type(self, hits: frozenset) -> str:
+        """Extract the UI type from keyword hits"""
+        for ui_type in self.UI_TYPES:
+            if ('ui_type', ui_type) in hits:
                 return ui_type
-        
-        # If no specific type found, infer from components
-        if 'input' in text and 'button' in text:
-            return 'form'
-        elif 'card' in text or 'kpi' in text:
+
+        # If no specific type found, a KPI mention still implies a dashboard
+        # (the old input+button / card fallbacks were unreachable: those
+        # keywords always match a UI type above)
+        if ('hint', 'kpi') in hits:
             return 'dashboard'
-        
+
         return 'generic'  # Default
-    
-    def _extract_components(self, text: str) -> List[str]:
-        """Extract component names from text"""
-        found_components = []
-        
-        for component, keywords in self.COMPONENTS.items():
-            if any(keyword in text for keyword in keywords):
-                if component not in found_components:
-                    found_components.append(component)
-        
+
+    def _extract_components(self, hits: frozenset, ui_type: str) -> List[str]:
+        """Extract component names from keyword hits"""
+        found_components = [
+            component for component in self.COMPONENTS
+            if ('component', component) in hits
+        ]
+
         # If no components found, infer from UI type
         if not found_components:
-            found_components = self._infer_components_from_ui_type(
-                self._extract_ui_type(text)
-            )
-        
+            found_components = self._infer_components_from_ui_type(ui_type)
+
         return found_components
-    
-    def _extract_layout(self, text: str) -> str:
-        """Extract layout type from text"""
-        for layout, keywords in self.LAYOUTS.items():
-            if any(keyword in text for keyword in keywords):
+
+    def _extract_layout(self, hits: frozenset) -> str:
+        """Extract layout type from keyword hits"""
+        for layout in self.LAYOUTS:
+            if ('layout', layout) in hits:
                 return layout
         return 'flex'  # Default layout
-    
-    def _extract_modifiers(self, text: str) -> Dict[str, any]:
+
+    def _extract_modifiers(self, text: str, hits: frozenset) -> Dict[str, any]:
         """Extract additional modifiers (variant, color, etc.)"""
         modifiers = {}
-        
+
         # Extract variant
-        for variant, keywords in self.VARIANTS.items():
-            if any(keyword in text for keyword in keywords):
+        for variant in self.VARIANTS:
+            if ('variant', variant) in hits:
                 modifiers['variant'] = variant
                 break
-        
+
         # Extract color
-        for color, keywords in self.COLORS.items():
-            if any(keyword in text for keyword in keywords):
+        for color in self.COLORS:
+            if ('color', color) in hits:
                 modifiers['color'] = color
                 break
-        
+
         # Extract size
-        if 'large' in text or 'big' in text:
-            modifiers['size'] = 'large'
-        elif 'small' in text or 'tiny' in text:
-            modifiers['size'] = 'small'
-        
+        for size in self.SIZES:
+            if ('size', size) in hits:
+                modifiers['size'] = size
+                break
+
         # Extract numbers (for tables, charts, etc.)
-        numbers = re.findall(r'\b(\d+)\b', text)
-        if numbers:
-            modifiers['count'] = int(numbers[0])
+        count = _first_int(text)
+        if count is not None:
+            modifiers['count'] = count
         
         return modifiers
     
@@ -206,21 +290,28 @@ class IntentParser:
         }
         return defaults.get(ui_type, ['Card'])
     
-    def _calculate_confidence(self, action: str, ui_type: str, 
+    def _calculate_confidence(self, action: str, ui_type: str,
                             components: List[str]) -> float:
         """Calculate confidence score for the parsed intent"""
-        score = 0.5  # Base score
-        
-        if action != 'create':
-            score += 0.1
-        
-        if ui_type != 'generic':
-            score += 0.2
-        
-        if components:
-            score += 0.2
-        
-        return min(score, 1.0)
+        # Branchless weighted sum over a 0.5 base score
+        score = (0.5
+                 + 0.1 * (action != 'create')
+                 + 0.2 * (ui_type != 'generic')
+                 + 0.2 * bool(components))
+        return score if score < 1.0 else 1.0
+
+
+# Build the shared keyword scanner once at import time
+IntentParser._KEYWORD_INDEX, IntentParser._KEYWORD_RE = _build_keyword_scanner([
+    ('action', IntentParser.ACTIONS),
+    ('ui_type', IntentParser.UI_TYPES),
+    ('component', IntentParser.COMPONENTS),
+    ('layout', IntentParser.LAYOUTS),
+    ('variant', IntentParser.VARIANTS),
+    ('color', IntentParser.COLORS),
+    ('size', IntentParser.SIZES),
+    ('hint', {'kpi': ['kpi']}),
+])
 
 
 # Example usage
@@ -2,12 +2,19 @@
 FastAPI Backend - Rule-based UI Generator
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Optional
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+import hashlib
+import logging
 import os
 
+logger = logging.getLogger("ui_generator")
+
 # Import local modules
 from intent_parser import IntentParser
 from planner import Planner
@@ -17,7 +24,8 @@ from code_validator import CodeValidator
 # Initialize FastAPI app
 app = FastAPI(
     title="Rule-Based UI Generator",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # CORS Configuration
@@ -36,15 +44,88 @@ code_generator = CodeGenerator()
 code_validator = CodeValidator()
 
 class GenerateRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     prompt: str
     current_code: Optional[str] = None
 
 class GenerateResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
     code: str
     explanation: str
     plan: dict
     validation: dict
 
+class BatchGenerateRequest(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+
+    prompts: List[str]
+
+
+@lru_cache(maxsize=256)
+def _generate_code(prompt: str) -> str:
+    """
+    Run the parse -> plan -> generate pipeline for a single prompt.
+
+    Plans and generated code are deterministic functions of the prompt, so
+    identical prompts are served straight from the cache (Intent objects
+    are additionally cached inside IntentParser).
+    """
+    intent = intent_parser.parse(prompt)
+    plan = planner.create_plan(intent)
+    return code_generator.generate(plan)
+
+
+@lru_cache(maxsize=256)
+def _pipeline(prompt: str) -> tuple:
+    """
+    Run the full endpoint pipeline (parse -> plan -> generate -> validate,
+    with the auto-fix pass) and return the four response fields.
+
+    Like the code itself, validation of the code is deterministic per
+    prompt, so warm prompts skip every pipeline stage. Cached dicts are
+    shared across requests and must not be mutated.
+    """
+    intent = intent_parser.parse(prompt)
+    plan = planner.create_plan(intent)
+    code = code_generator.generate(plan)
+    code, validation_result = code_validator.validate_and_fix(code)
+
+    return (
+        code,
+        plan.reasoning,
+        {
+            "layout": plan.layout_type,
+            "components": [
+                {"type": c.type, "props": c.props}
+                for c in plan.components
+            ],
+            "imports": plan.imports
+        },
+        {
+            "is_valid": validation_result.is_valid,
+            "errors": validation_result.errors,
+            "warnings": validation_result.warnings,
+            "suggestions": validation_result.suggestions
+        },
+    )
+
+
+def generate_many(prompts: List[str], workers: Optional[int] = None) -> List[str]:
+    """
+    Generate code for many prompts (bulk workloads: evals, dataset creation).
+
+    Small batches run in-process and benefit from the parser's LRU cache;
+    larger batches fan out across a process pool since the pipeline is pure
+    Python string work that never releases the GIL.
+    """
+    if len(prompts) <= 8:
+        return [_generate_code(prompt) for prompt in prompts]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_generate_code, prompts, chunksize=32))
+
 @app.get("/")
 async def root():
     return {
@@ -59,54 +140,57 @@ async def health_check():
         "pipeline": "rule-based"
     }
 
-@app.post("/api/generate", response_model=GenerateResponse)
-async def generate_ui(request: GenerateRequest):
+@app.post("/api/generate")
+def generate_ui(request: GenerateRequest, http_request: Request, response: Response):
+    # Plain def: the pipeline is synchronous CPU work, so Starlette runs it
+    # on the threadpool instead of blocking the event loop
     try:
         prompt = request.prompt.strip()
         if not prompt:
             raise HTTPException(status_code=400, detail="Prompt required")
 
-        intent = intent_parser.parse(prompt)
-        plan = planner.create_plan(intent)
-        code = code_generator.generate(plan)
-        validation_result = code_validator.validate(code)
-        
-        if not validation_result.is_valid:
-            code = code_validator.fix_common_issues(code)
-            validation_result = code_validator.validate(code)
+        # The pipeline is deterministic per prompt, so an ETag over the
+        # prompt lets re-submitting clients short-circuit with a 304
+        # before any pipeline work (current_code is not hashed: the
+        # pipeline never reads it)
+        etag = '"' + hashlib.sha256(prompt.encode()).hexdigest() + '"'
+        if http_request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
 
-        return GenerateResponse(
+        response.headers["ETag"] = etag
+        code, explanation, plan_dict, validation = _pipeline(prompt)
+
+        # The pipeline builds these fields itself, so skip Pydantic's
+        # response validation pass with model_construct
+        return GenerateResponse.model_construct(
             code=code,
-            explanation=plan.reasoning,
-            plan={
-                "layout": plan.layout_type,
-                "components": [
-                    {"type": c.type, "props": c.props}
-                    for c in plan.components
-                ],
-                "imports": plan.imports
-            },
-            validation={
-                "is_valid": validation_result.is_valid,
-                "errors": validation_result.errors,
-                "warnings": validation_result.warnings,
-                "suggestions": validation_result.suggestions
-            }
+            explanation=explanation,
+            plan=plan_dict,
+            validation=validation
         )
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/generate/batch")
+def generate_ui_batch(request: BatchGenerateRequest):
+    if not request.prompts:
+        raise HTTPException(status_code=400, detail="Prompts required")
+    return {"codes": generate_many(request.prompts)}
+
 if __name__ == "__main__":
     import uvicorn
     
     # ✅ FIX: Use Railway's PORT environment variable
     port = int(os.environ.get("PORT", 8000))
-    print(f"🚀 Starting on port {port}")
+    logging.basicConfig(level=logging.INFO)
+    logger.info("🚀 Starting on port %d", port)
     
     uvicorn.run(
         app,
         host="0.0.0.0",
         port=port,  # ✅ Dynamic port from Railway
+        loop="uvloop",      # libuv event loop (ships with uvicorn[standard])
+        http="httptools",   # C HTTP parser
         log_level="info"
     )